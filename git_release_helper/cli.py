@@ -1,24 +1,86 @@
 import re
 import os
 import datetime
+import functools
+from pathlib import Path
 import click
-import git
-import yaml
 from git_release_helper.config import (
-    get_default_branches, get_ticket_pattern, get_tag_format,
+    get_default_branches, get_ticket_pattern_re, compile_ticket_pattern, get_tag_format,
     get_project_name, get_message_format, get_templates_dir, ensure_templates_dir,
     get_connector_type, get_connector_config, get_config_path, get_local_config_path,
-    get_config_content, load_config, generate_local_config
+    get_config_content, load_config, generate_local_config, dump_yaml,
+    get_project_name_from_url
 )
 from git_release_helper.connectors import get_connector
 
+# Tag format date placeholders and their strftime directives, longest first
+TAG_DATE_PLACEHOLDERS = (
+    ("YYYY", "%Y"),
+    ("YY", "%y"),
+    ("MM", "%m"),
+    ("DD", "%d"),
+)
+
+# Shared stand-in for tickets without connector details; never mutated
+_EMPTY_TICKET_INFO = {}
+
+# Splits a string into alternating text and digit runs for natural sorting
+DIGITS_SPLIT_RE = re.compile(r"(\d+)")
+
+# Size of the chunks read from the git log output when extracting tickets
+LOG_CHUNK_SIZE = 64 * 1024
+
+# Placeholders supported in release message templates
+TEMPLATE_PLACEHOLDER_RE = re.compile(r"\[(PROJECT_NAME|TAG_NAME|TICKETS_LIST)\]")
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_pattern(pattern):
+    """Compile a regex pattern once per process and reuse it on later calls."""
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=16)
+def _tag_strftime_format(tag_format):
+    """Translate the date placeholders of a tag format into strftime directives."""
+    # Escape literal percent signs so strftime leaves them untouched
+    strftime_format = tag_format.replace("%", "%%")
+    for placeholder, directive in TAG_DATE_PLACEHOLDERS:
+        strftime_format = strftime_format.replace(placeholder, directive)
+    return strftime_format
+
+
+def _compile_template(template_content):
+    """Convert a template with [PLACEHOLDER] markers into a str.format_map template."""
+    # Escape literal braces so that only the known placeholders get substituted
+    escaped_content = template_content.replace("{", "{{").replace("}", "}}")
+    return TEMPLATE_PLACEHOLDER_RE.sub(r"{\1}", escaped_content)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template(template_file, mtime_ns, size):  # pylint: disable=unused-argument
+    """
+    Read a template file and compile it for str.format_map.
+
+    The modification time and size only serve as cache keys, so that an edited
+    template is read and compiled again.
+    """
+    return _compile_template(Path(template_file).read_text(encoding='utf-8'))
+
+
+def _natural_sort_key(value):
+    """Sort key that compares digit runs numerically, so ALLI-9 sorts before ALLI-10."""
+    return [int(part) if part.isdecimal() else part for part in DIGITS_SPLIT_RE.split(value)]
+
 
 def get_repo():
     """Get the current git repository."""
+    import git
+
     try:
         return git.Repo(os.getcwd())
     except git.exc.InvalidGitRepositoryError:
-        click.echo("Current directory is not a git repository.")
+        click.echo("Current directory is not a git repository.", err=True)
         return None
 
 
@@ -34,78 +96,117 @@ def validate_branch(repo, force=False):
     return True
 
 
-def generate_tag_name(repo):
+def get_tags_by_name(repo):
+    """Get a mapping of tag names to tag references, enumerating the tags once."""
+    return {tag.name: tag for tag in repo.tags}
+
+
+def generate_tag_name(tags_by_name):
     """Generate a new tag name based on the configured format."""
     # Get the tag format from config
     tag_format = get_tag_format()
     today = datetime.datetime.now()
 
-    # Replace placeholders in the tag format
-    tag_base = tag_format
-    tag_base = tag_base.replace("YYYY", today.strftime("%Y"))
-    tag_base = tag_base.replace("YY", today.strftime("%y"))
-    tag_base = tag_base.replace("MM", today.strftime("%m"))
-    tag_base = tag_base.replace("DD", today.strftime("%d"))
+    # Replace date placeholders in the tag format with a single strftime call
+    tag_base = today.strftime(_tag_strftime_format(tag_format))
 
     # Create a regex pattern to match existing tags with the same format
     tag_pattern = tag_base.replace("N", r"(\d+)")
-    tag_regex = re.compile(tag_pattern)
+    tag_regex = _compile_pattern(tag_pattern)
 
     # Find all tags matching today's format
     matching_tags = []
-    for tag in repo.tags:
-        match = tag_regex.match(tag.name)
+    for name in tags_by_name:
+        match = tag_regex.match(name)
         if match:
             try:
                 tag_name = int(match.group(1))
-                matching_tags.append((tag.name, tag_name))
+                matching_tags.append((name, tag_name))
             except (ValueError, IndexError):
                 continue
 
     # Determine the next sequence number
-    next_n = 1
-    if matching_tags:
-        next_n = max([n for _, n in matching_tags]) + 1
+    next_n = max((n for _, n in matching_tags), default=0) + 1
 
     # Set the new tag name
     return tag_base.replace("N", str(next_n))
 
 
 def find_last_tag(repo):
-    """Find the most recently created tag in the repository."""
+    """Find the most recent tag reachable from the current commit."""
+    import git
+
+    # Let git walk back from HEAD to the nearest tag instead of inspecting every tag
     try:
-        # Sort tags by commit date in descending order
-        tags = sorted(repo.tags, key=lambda t: t.commit.committed_datetime, reverse=True)
-        if tags:
-            return tags[0].name
+        return repo.git.describe("--tags", "--abbrev=0", "HEAD") or None
+    except git.exc.GitCommandError:
+        # No tag is reachable from HEAD
         return None
-    except git.exc.GitCommandError as ex:
-        click.echo(f"Error finding last tag: {str(ex)}")
-        return None
-
-
-def extract_tickets_from_commits(commits, ticket_pattern):
-    """Extract ticket numbers from commit messages."""
-    ticket_regex = re.compile(ticket_pattern)
-    tickets = set()
-
-    for commit in commits:
-        commit_message = commit.message.strip()
-        matches = ticket_regex.findall(commit_message)
-        tickets.update(matches)
-
-    return sorted(tickets)
 
 
-def generate_release_message(project_name, tag, tickets, format_to_use, ticket_details=None):
-    """Generate a release message based on the specified format."""
+def extract_tickets_from_commits(repo, rev_range, ticket_pattern):
+    """
+    Extract ticket numbers from the messages of the commits in a revision range.
+
+    The ticket pattern may be given as a string or as an already compiled regex.
+    """
+    if isinstance(ticket_pattern, str):
+        ticket_pattern = compile_ticket_pattern(ticket_pattern)
+    ticket_regex = ticket_pattern
+    # Bytes patterns match the raw git log so that messages are never decoded;
+    # str patterns need the messages as text to keep their Unicode semantics
+    decode_messages = isinstance(ticket_regex.pattern, str)
+    raw_tickets = set()
+
+    def scan(messages):
+        if decode_messages:
+            messages = messages.decode("utf-8", "replace")
+        raw_tickets.update(match.group(0) for match in ticket_regex.finditer(messages))
+
+    # Separate messages with NUL bytes, which cannot appear in a commit message
+    log_args = [rev_range] if rev_range else []
+    process = repo.git.log(*log_args, "--format=%B%x00", as_process=True)
+
+    pending = b""
+    for chunk in iter(lambda: process.stdout.read(LOG_CHUNK_SIZE), b""):
+        pending += chunk
+        # Only scan complete messages so that no ticket is split between two chunks
+        boundary = pending.rfind(b"\x00") + 1
+        scan(pending[:boundary])
+        pending = pending[boundary:]
+
+    scan(pending)
+    process.wait()
+
+    if not decode_messages:
+        raw_tickets = {ticket.decode("utf-8", "replace") for ticket in raw_tickets}
+    return sorted(raw_tickets, key=_natural_sort_key)
+
+
+def _format_ticket_line(ticket, ticket_details):
+    """Format a single ticket as a list item with its title and status if known."""
+    ticket_info = ticket_details.get(ticket) or _EMPTY_TICKET_INFO
+    title = ticket_info.get('title')
+    status = ticket_info.get('status')
+
+    if title and status:
+        return f"- {ticket}: {title} ({status})"
+    if title:
+        return f"- {ticket}: {title}"
+    return f"- {ticket}"
+
+
+def generate_release_message(project_name, tag, ticket_lines, format_to_use):
+    """Generate a release message from formatted ticket lines in the specified format."""
     template_file = os.path.join(get_templates_dir(), f"{format_to_use}.template")
 
-    # Read template file
+    # Read template file, reusing the compiled template while the file is unchanged
     try:
-        with open(template_file, 'r', encoding='utf-8') as file:
-            template_content = file.read()
-    except (IOError, OSError, UnicodeDecodeError):
+        template_stat = os.stat(template_file)
+        template = _load_template(
+            template_file, template_stat.st_mtime_ns, template_stat.st_size
+        )
+    except (OSError, UnicodeDecodeError):
         # Fallback to default template if file can't be read
         if format_to_use == 'markdown':
             template_content = (
@@ -114,63 +215,48 @@ def generate_release_message(project_name, tag, tickets, format_to_use, ticket_d
             )
         else:
             template_content = "Deploying [PROJECT_NAME] [TAG_NAME]\n\nTickets:\n[TICKETS_LIST]"
+        template = _compile_template(template_content)
 
-    # Format tickets list based on format
-    if tickets:
-        if ticket_details:
-            # Include ticket titles and statuses if available
-            tickets_list = []
-            for ticket in tickets:
-                ticket_info = ticket_details.get(ticket, {})
-                title = ticket_info.get('title', '')
-                status = ticket_info.get('status', '')
-
-                if title and status:
-                    tickets_list.append(f"- {ticket}: {title} ({status})")
-                elif title:
-                    tickets_list.append(f"- {ticket}: {title}")
-                else:
-                    tickets_list.append(f"- {ticket}")
-
-            tickets_list = "\n".join(tickets_list)
-        else:
-            tickets_list = "\n".join([f"- {ticket}" for ticket in tickets])
+    # Join the already formatted ticket lines
+    if ticket_lines:
+        tickets_list = "\n".join(ticket_lines)
     else:
         tickets_list = "No tickets found in this release."
 
-    # Replace placeholders in template
-    release_message = template_content
-    release_message = release_message.replace("[PROJECT_NAME]", project_name)
-    release_message = release_message.replace("[TAG_NAME]", tag)
-    release_message = release_message.replace("[TICKETS_LIST]", tickets_list)
+    # Replace placeholders in template in a single pass
+    release_message = template.format_map({
+        "PROJECT_NAME": project_name,
+        "TAG_NAME": tag,
+        "TICKETS_LIST": tickets_list,
+    })
 
     return release_message
 
 
 def check_remote_branch(repo, current_branch):
     """Check if local branch is outdated compared to remote."""
-    remote_refs = {}
-    for remote in repo.remotes:
-        try:
-            for ref in remote.refs:
-                remote_refs[ref.name.split('/')[-1]] = ref
-        except AssertionError:
-            # Remote has no references
-            continue
-
-    if current_branch in remote_refs:
-        remote_branch = remote_refs[current_branch]
-        behind_count = len(list(repo.iter_commits(f"{current_branch}..{remote_branch.name}")))
+    # Compare against the upstream branch the current branch tracks, if any
+    remote_branch = repo.active_branch.tracking_branch()
+    if remote_branch is not None and remote_branch.is_valid():
+        # Count commits on each side of the symmetric difference in one git call
+        ahead_count, behind_count = map(int, repo.git.rev_list(
+            "--left-right", "--count", f"{current_branch}...{remote_branch.name}"
+        ).split())
 
         if behind_count > 0:
             click.echo(
                 f"\nYour local branch is {behind_count} "
                 f"commit{'s' if behind_count > 1 else ''} behind the remote."
             )
+            if ahead_count > 0:
+                click.echo(
+                    f"It also has {ahead_count} local "
+                    f"commit{'s' if ahead_count > 1 else ''} that the remote does not have."
+                )
             click.echo("Updating your branch is recommended to ensure you have the latest changes.")
             if click.confirm("Would you like to update your local branch now?"):
                 click.echo("Pulling latest changes...")
-                repo.remotes.origin.pull()
+                repo.remote(remote_branch.remote_name).pull()
                 click.echo("Branch updated successfully.")
             else:
                 click.echo("Continuing with local branch state.")
@@ -178,62 +264,87 @@ def check_remote_branch(repo, current_branch):
 
 def extract_project_name(repo):
     """Extract project name from repository."""
+    # First check if project_name is set in config
+    configured_name = get_project_name()
+    if configured_name:
+        return configured_name
+
+    # Otherwise extract from the origin remote URL
     try:
-        # First check if project_name is set in config
-        configured_name = get_project_name()
-        if configured_name:
-            return configured_name
-
-        # Otherwise extract from git repo
-        if hasattr(repo, 'remotes') and repo.remotes:
-            # Try to extract from remote URL
-            remote_url = repo.remotes.origin.url
-            if remote_url:
-                # Extract project name from remote URL
-                # Handle different formats: https://github.com/user/project.git
-                # or git@github.com:user/project.git
-                if remote_url.endswith('.git'):
-                    remote_url = remote_url[:-4]  # Remove .git suffix
-
-                project_name = os.path.basename(remote_url)
-                if project_name:
-                    return project_name
-
-        # Fallback to directory name
-        dir_name = os.path.basename(os.path.normpath(repo.working_dir))
-        if dir_name:
-            return dir_name
-
-        return "Unknown Project"
-    except (AttributeError, TypeError, KeyError) as ex:
-        print(f"Error getting project name: {str(ex)}")
-        return "Unknown Project"
-
-
-def handle_tag(repo, tag):
+        remote_url = repo.remote("origin").url
+    except ValueError:
+        # Repository has no origin remote
+        remote_url = None
+
+    if remote_url:
+        project_name = get_project_name_from_url(remote_url)
+        if project_name:
+            return project_name
+
+    # Fallback to directory name
+    dir_name = os.path.basename(repo.working_tree_dir or os.getcwd())
+    return dir_name or "Unknown Project"
+
+
+def handle_tag(tag, tags_by_name, project_name):
     """Handle tag validation or generation and return tag information."""
     tag_exists = False
     if not tag:
-        tag = generate_tag_name(repo)
-        project_name = extract_project_name(repo)
+        tag = generate_tag_name(tags_by_name)
         click.echo(f"Generated tag name for {project_name}: {tag}")
     else:
         # Check if the provided tag exists
-        try:
-            repo.tags[tag]
-            tag_exists = True
-            click.echo(f"Error: Tag '{tag}' already exists in the repository.")
-            click.echo("Please specify a different tag name or let the application generate one.")
+        if tag in tags_by_name:
+            click.echo(
+                f"Error: Tag '{tag}' already exists in the repository.\n"
+                "Please specify a different tag name or let the application generate one.",
+                err=True
+            )
             return None, None
-        except IndexError:
-            click.echo(f"Tag '{tag}' will be created at the end "
-                       "of the process with your confirmation.")
+
+        click.echo(f"Tag '{tag}' will be created at the end "
+                   "of the process with your confirmation.")
 
     return tag, tag_exists
 
 
-def prepare_release(repo, tag, tag_exists, message_format):
+def fetch_ticket_details(connector_type, tickets):
+    """Fetch ticket details from the configured connector, or an empty dict on failure."""
+    click.echo(f"\nFetching ticket details from {connector_type.upper()}...")
+    try:
+        connector_config = get_connector_config(connector_type)
+        connector = get_connector(connector_type, connector_config)
+        if not connector:
+            click.echo(f"Unsupported connector type: {connector_type}", err=True)
+            return {}
+
+        # Close the connector, and with it any open connections, once done
+        with connector:
+            if not connector.validate_connection():
+                click.echo(
+                    f"Could not connect to {connector_type.upper()}. "
+                    "Check your configuration.",
+                    err=True
+                )
+                return {}
+
+            ticket_details = connector.get_ticket_details(tickets)
+    except (ConnectionError, ValueError, TypeError) as ex:
+        click.echo(f"Error connecting to {connector_type.upper()}: {str(ex)}", err=True)
+        return {}
+
+    if ticket_details:
+        click.echo("Successfully retrieved ticket details.")
+    else:
+        click.echo("No ticket details could be retrieved.")
+
+    return ticket_details
+
+
+def prepare_release(repo, tag, tag_exists, message_format, *, project_name):
     """Prepare release information including commits, tickets, and message."""
+    import git
+
     # Find the last tag in the repository
     last_tag = None
     if not tag_exists:
@@ -242,90 +353,95 @@ def prepare_release(repo, tag, tag_exists, message_format):
         last_tag = tag
 
     # Get commits after the last tag
-    commits_after_tag = []
+    rev_range = None
     if last_tag:
         try:
-            commits_after_tag = list(repo.iter_commits(f"{last_tag}..HEAD"))
+            commit_count = int(repo.git.rev_list("--count", f"{last_tag}..HEAD"))
 
             # Display information about the last tag
-            tag_commit = repo.tags[last_tag].commit
+            # Resolve the tag from git, as it may have arrived with a pull
+            tag_commit = repo.commit(last_tag)
             tag_commit_message = tag_commit.message.strip()
 
-            click.echo(f"\nPreparing release based on changes after tag: {last_tag}")
-            click.echo(f"Last tag commit: {tag_commit.hexsha}")
-            click.echo(f"Last tag message: {tag_commit_message}")
+            click.echo("\n".join([
+                f"\nPreparing release based on changes after tag: {last_tag}",
+                f"Last tag commit: {tag_commit.hexsha}",
+                f"Last tag message: {tag_commit_message}",
+            ]))
 
             # Check if there are any commits after the tag
-            if not commits_after_tag:
-                click.echo(f"Error: No commits found after tag '{last_tag}'.")
-                click.echo("There's nothing to release. Create new commits before "
-                           "making a release.")
+            if not commit_count:
+                click.echo(
+                    f"Error: No commits found after tag '{last_tag}'.\n"
+                    "There's nothing to release. Create new commits before making a release.",
+                    err=True
+                )
                 return None
-        except (IndexError, git.exc.GitCommandError) as ex:
-            click.echo(f"Error analyzing commits after tag: {str(ex)}")
+
+            rev_range = f"{last_tag}..HEAD"
+        except git.exc.GitCommandError as ex:
+            click.echo(f"Error analyzing commits after tag: {str(ex)}", err=True)
             return None
     else:
         # No tags exist, use all commits
-        commits_after_tag = list(repo.iter_commits())
         click.echo("\nNo previous tags found. Using all commits for this release.")
 
     # Extract ticket names from commit messages
-    ticket_pattern = get_ticket_pattern()
-    tickets = extract_tickets_from_commits(commits_after_tag, ticket_pattern)
+    tickets = extract_tickets_from_commits(repo, rev_range, get_ticket_pattern_re())
 
     # Get ticket details from connector if available
     ticket_details = {}
     connector_type = get_connector_type()
     if connector_type and tickets:
-        click.echo(f"\nFetching ticket details from {connector_type.upper()}...")
-        try:
-            connector_config = get_connector_config(connector_type)
-            connector = get_connector(connector_type, connector_config)
-
-            if connector and connector.validate_connection():
-                ticket_details = connector.get_ticket_details(tickets)
-                if ticket_details:
-                    click.echo("Successfully retrieved ticket details.")
-                else:
-                    click.echo("No ticket details could be retrieved.")
-            else:
-                click.echo(
-                    f"Could not connect to {connector_type.upper()}. "
-                    "Check your configuration."
-                )
-        except (ConnectionError, ValueError, TypeError) as ex:
-            click.echo(f"Error connecting to {connector_type.upper()}: {str(ex)}")
+        ticket_details = fetch_ticket_details(connector_type, tickets)
+
+    # Format each ticket once for both the console output and the release message
+    ticket_lines = [_format_ticket_line(ticket, ticket_details) for ticket in tickets]
 
     # Display ticket information
-    if tickets:
-        click.echo("\nHere is the list of tickets that were merged after last release:")
-        for ticket in tickets:
-            ticket_title = ticket_details.get(ticket, {}).get('title', '')
-            ticket_status = ticket_details.get(ticket, {}).get('status', '')
-            if ticket_title:
-                if ticket_status:
-                    click.echo(f"- {ticket}: {ticket_title} ({ticket_status})")
-                else:
-                    click.echo(f"- {ticket}: {ticket_title}")
-            else:
-                click.echo(f"- {ticket}")
+    if ticket_lines:
+        click.echo("\n".join(
+            ["\nHere is the list of tickets that were merged after last release:", *ticket_lines]
+        ))
     else:
         click.echo("\nNo tickets found in commits after the last release.")
 
-    # Get project name from repository
-    project_name = extract_project_name(repo)
-
     # Determine message format to use
     format_to_use = message_format if message_format else get_message_format()
 
     # Generate release message
     release_message = generate_release_message(
-        project_name, tag, tickets, format_to_use, ticket_details
+        project_name, tag, ticket_lines, format_to_use
     )
 
     return release_message
 
 
+def show_configuration():
+    """Show the paths and contents of the global and local configuration files."""
+    # Show global configuration
+    global_config_path = get_config_path()
+    click.echo(f"Global configuration file: {global_config_path}")
+    click.echo("=====================")
+    if os.path.exists(global_config_path):
+        click.echo(get_config_content(global_config_path))
+    else:
+        click.echo("Global configuration file does not exist.")
+    click.echo()
+
+    # Show local configuration if it exists
+    local_config_path = get_local_config_path()
+    if local_config_path:
+        click.echo(f"Local configuration file: {local_config_path}")
+        click.echo("=====================")
+        click.echo(get_config_content(local_config_path))
+        click.echo()
+
+        click.echo("Final configuration:")
+        click.echo("=====================")
+        click.echo(dump_yaml(load_config()))
+
+
 @click.group()
 def main():
     """Git Release Helper CLI."""
@@ -341,65 +457,57 @@ def main():
               help='Format for the release message. Overrides the configuration setting.')
 def release(tag, force, show_config, message_format):
     """Create a new release."""
+    # Show configuration file path and contents if requested
+    if show_config:
+        show_configuration()
+        return
+
+    # GitPython is slow to import, so it is only loaded once a repository is needed
+    import git
+
     try:
         # Ensure templates directory exists
         ensure_templates_dir()
 
-        # Show configuration file path and contents if requested
-        if show_config:
-            # Show global configuration
-            global_config_path = get_config_path()
-            click.echo(f"Global configuration file: {global_config_path}")
-            click.echo("=====================")
-            if os.path.exists(global_config_path):
-                click.echo(get_config_content(global_config_path))
-            else:
-                click.echo("Global configuration file does not exist.")
-            click.echo()
-
-            # Show local configuration if it exists
-            local_config_path = get_local_config_path()
-            if local_config_path:
-                click.echo(f"Local configuration file: {local_config_path}")
-                click.echo("=====================")
-                click.echo(get_config_content(local_config_path))
-                click.echo()
-
-                click.echo("Final configuration:")
-                click.echo("=====================")
-                click.echo(yaml.dump(load_config(), default_flow_style=False, sort_keys=False))
-
-            return
-
         # Get the current repository
         repo = get_repo()
         if not repo:
-            return
+            raise click.Abort()
 
         # Validate current branch
         if not validate_branch(repo, force):
             click.echo("Operation cancelled.")
             return
 
+        # Enumerate the repository tags and resolve the project name once for the whole release
+        tags_by_name = get_tags_by_name(repo)
+        project_name = extract_project_name(repo)
+
         # Handle tag (generate or validate)
-        tag, tag_exists = handle_tag(repo, tag)
+        tag, tag_exists = handle_tag(tag, tags_by_name, project_name)
         if tag is None:
-            return
+            raise click.Abort()
 
         # Check if local branch is outdated
         current_branch = repo.active_branch.name
         check_remote_branch(repo, current_branch)
 
         # Prepare release information
-        release_message = prepare_release(repo, tag, tag_exists, message_format)
+        release_message = prepare_release(
+            repo, tag, tag_exists, message_format,
+            project_name=project_name
+        )
         if release_message is None:
-            return
+            # The reason has already been reported, so just exit with a failure status
+            raise click.Abort()
 
         # Display the release message
-        click.echo("\nGenerated Release Message:")
-        click.echo("==========================")
-        click.echo(release_message)
-        click.echo("==========================")
+        click.echo("\n".join([
+            "\nGenerated Release Message:",
+            "==========================",
+            release_message,
+            "==========================",
+        ]))
 
         # Ask for confirmation to create the tag
         if not tag_exists:
@@ -411,15 +519,19 @@ def release(tag, force, show_config, message_format):
                 click.echo("Tag creation cancelled.")
                 return
 
-        click.echo("\nTo create a GitHub release, use the following information:")
-        click.echo(f"Tag: {tag}")
-        click.echo(f"Title: Release {tag}")
-        click.echo("Description: Use the generated release message above")
+        click.echo("\n".join([
+            "\nTo create a GitHub release, use the following information:",
+            f"Tag: {tag}",
+            f"Title: Release {tag}",
+            "Description: Use the generated release message above",
+        ]))
 
-    except git.exc.InvalidGitRepositoryError:
-        click.echo("Current directory is not a git repository.")
+    except git.exc.InvalidGitRepositoryError as ex:
+        click.echo("Current directory is not a git repository.", err=True)
+        raise click.Abort() from ex
     except (git.exc.GitError, IOError, ValueError) as ex:
-        click.echo(f"An error occurred: {str(ex)}")
+        click.echo(f"An error occurred: {str(ex)}", err=True)
+        raise click.Abort() from ex
 
 
 @main.command()
@@ -442,7 +554,8 @@ def init():
             click.echo("Failed to initialize local configuration.")
 
     except (IOError, ValueError, KeyError) as ex:
-        click.echo(f"An error occurred: {str(ex)}")
+        click.echo(f"An error occurred: {str(ex)}", err=True)
+        raise click.Abort() from ex
 
 
 if __name__ == '__main__':
@@ -1,7 +1,7 @@
 import os
-import yaml
+import re
+import copy
 import click
-import git
 
 # Default configuration values
 DEFAULT_CONFIG = {
@@ -22,6 +22,20 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Default message templates, keyed by file name
+DEFAULT_TEMPLATES = {
+    "markdown.template": "# Deploying [PROJECT_NAME] `[TAG_NAME]`\n\n## Tickets:\n[TICKETS_LIST]",
+    "plain.template": "Deploying [PROJECT_NAME] [TAG_NAME]\n\nTickets:\n[TICKETS_LIST]",
+}
+
+# Last path component of a git remote URL, without a trailing ".git" or slash
+PROJECT_NAME_RE = re.compile(r"([^:/]+?)(?:\.git)?/*$")
+
+# Regex constructs that behave differently on bytes than on text: Unicode-aware
+# classes, negated classes and "." (which would match single UTF-8 code units)
+# and inline flags
+UNICODE_SENSITIVE_RE = re.compile(r"\\[bBwWdDsS]|\[\^|\(\?[a-zA-Z]|(?<!\\)\.")
+
 # Configuration paths
 CONFIG_DIR = os.path.expanduser("~/.git-release-helper")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.yml")
@@ -30,32 +44,67 @@ LOCAL_CONFIG_FILE = ".release_config.yml"
 # Global configuration variable
 _CONFIG = None
 
+# Ticket pattern compiled from the loaded configuration
+_TICKET_PATTERN_RE = None
+
+# Whether the templates directory has been checked for the loaded configuration
+_TEMPLATES_ENSURED = False
+
+def load_yaml(stream):
+    """Parse a YAML document from a string or file."""
+    import yaml
+
+    # Prefer the libyaml C bindings and fall back to the pure Python implementation
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+def dump_yaml(data, stream=None):
+    """Serialize data to YAML in block style, keeping the key order."""
+    import yaml
+
+    return yaml.dump(
+        data, stream, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        default_flow_style=False, sort_keys=False
+    )
+
 def ensure_config_dir():
     """Ensure the config directory exists."""
-    if not os.path.exists(CONFIG_DIR):
-        os.makedirs(CONFIG_DIR)
+    os.makedirs(CONFIG_DIR, exist_ok=True)
 
 def ensure_templates_dir():
     """Ensure the templates directory exists and has default templates."""
+    # The directory only needs checking once per loaded configuration
+    if globals().get('_TEMPLATES_ENSURED'):
+        return
+
     templates_dir = get_templates_dir()
-    if not os.path.exists(templates_dir):
-        os.makedirs(templates_dir)
-
-    # Create default markdown template
-    markdown_template_path = os.path.join(templates_dir, "markdown.template")
-    if not os.path.exists(markdown_template_path):
-        with open(markdown_template_path, "w", encoding="utf-8") as file:
-            file.write("# Deploying [PROJECT_NAME] `[TAG_NAME]`\n\n")
-            file.write("## Tickets:\n")
-            file.write("[TICKETS_LIST]")
-
-    # Create default plain text template
-    plain_template_path = os.path.join(templates_dir, "plain.template")
-    if not os.path.exists(plain_template_path):
-        with open(plain_template_path, "w", encoding="utf-8") as file:
-            file.write("Deploying [PROJECT_NAME] [TAG_NAME]\n\n")
-            file.write("Tickets:\n")
-            file.write("[TICKETS_LIST]")
+    os.makedirs(templates_dir, exist_ok=True)
+
+    # List the directory once instead of probing each template file separately
+    with os.scandir(templates_dir) as entries:
+        existing_files = {entry.name for entry in entries}
+
+    # Create any missing default template
+    for file_name, template_content in DEFAULT_TEMPLATES.items():
+        if file_name not in existing_files:
+            template_path = os.path.join(templates_dir, file_name)
+            with open(template_path, "w", encoding="utf-8") as file:
+                file.write(template_content)
+
+    globals()['_TEMPLATES_ENSURED'] = True
+
+def _read_config_file(config_path, config_name):
+    """Read a YAML config file, returning None if it is missing or cannot be loaded."""
+    import yaml
+
+    # Open the file directly rather than checking for it first
+    try:
+        with open(config_path, 'r', encoding='utf-8') as file:
+            return load_yaml(file)
+    except FileNotFoundError:
+        return None
+    except (yaml.YAMLError, IOError) as ex:
+        click.echo(f"Error loading {config_name} config file: {str(ex)}")
+        return None
 
 def load_config():
     """Load configuration from file or create default if it doesn't exist."""
@@ -67,113 +116,135 @@ def load_config():
 
     ensure_config_dir()
 
-    # Start with default config
-    config = DEFAULT_CONFIG.copy()
+    # Start with a copy of the default config; nested sections are merged in place below
+    config = copy.deepcopy(DEFAULT_CONFIG)
 
     # Load global config if exists
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as file:
-                global_config = yaml.safe_load(file)
-                if global_config:
-                    config.update(global_config)
-        except (yaml.YAMLError, IOError) as ex:
-            click.echo(f"Error loading global config file: {str(ex)}")
+    global_config = _read_config_file(CONFIG_FILE, "global")
+    if global_config:
+        config.update(global_config)
 
     # Load local config if exists (overrides global config)
-    if os.path.exists(LOCAL_CONFIG_FILE):
-        try:
-            with open(LOCAL_CONFIG_FILE, 'r', encoding='utf-8') as file:
-                local_config = yaml.safe_load(file)
-                if local_config:
-                    # Merge connectors section if it exists in both configs
-                    if 'connectors' in local_config and 'connectors' in config:
-                        if local_config['connectors'].get('type'):
-                            config['connectors']['type'] = local_config['connectors']['type']
-
-                        # Merge connector-specific configs
-                        for connector_name, connector_config in local_config['connectors'].items():
-                            if connector_name != 'type' and connector_name in config['connectors']:
-                                config['connectors'][connector_name].update(connector_config)
-
-                    # Update other top-level keys
-                    for key, value in local_config.items():
-                        if key != 'connectors':
-                            config[key] = value
-
-                    click.echo("Local config loaded and applied.")
-        except (yaml.YAMLError, IOError) as ex:
-            click.echo(f"Error loading local config file: {str(ex)}")
+    local_config = _read_config_file(LOCAL_CONFIG_FILE, "local")
+    if local_config:
+        # Merge connectors section if it exists in both configs
+        if 'connectors' in local_config and 'connectors' in config:
+            if local_config['connectors'].get('type'):
+                config['connectors']['type'] = local_config['connectors']['type']
+
+            # Merge connector-specific configs
+            for connector_name, connector_config in local_config['connectors'].items():
+                if connector_name != 'type' and connector_name in config['connectors']:
+                    config['connectors'][connector_name].update(connector_config)
+
+        # Update other top-level keys
+        for key, value in local_config.items():
+            if key != 'connectors':
+                config[key] = value
+
+        click.echo("Local config loaded and applied.")
 
     # Store in module-level variable
     globals()['_CONFIG'] = config
 
     return config
 
+def invalidate_config():
+    """Drop the cached configuration so that the next access reloads it from disk."""
+    globals()['_CONFIG'] = None
+    globals()['_TICKET_PATTERN_RE'] = None
+    globals()['_TEMPLATES_ENSURED'] = False
+
 def save_config(config):
     """Save configuration to YAML file."""
     ensure_config_dir()
 
     try:
         with open(CONFIG_FILE, 'w', encoding='utf-8') as file:
-            yaml.dump(config, file, default_flow_style=False, sort_keys=False)
+            dump_yaml(config, file)
     except IOError as ex:
         click.echo(f"Error saving config file: {str(ex)}")
 
+    # Make later reads see the saved file rather than the cached configuration
+    invalidate_config()
+
+def _get_setting(key):
+    """Get a top-level setting from the loaded configuration, falling back to its default."""
+    return load_config().get(key, DEFAULT_CONFIG[key])
+
 def get_default_branches():
     """Get the list of default branch names."""
-    config = load_config()
-    return config.get("default_branches", DEFAULT_CONFIG["default_branches"])
+    return _get_setting("default_branches")
 
 def get_commit_message_format():
     """Get the commit message format."""
-    config = load_config()
-    return config.get("commit_message_format", DEFAULT_CONFIG["commit_message_format"])
+    return _get_setting("commit_message_format")
 
 def get_ticket_pattern():
     """Get the ticket pattern regex."""
-    config = load_config()
-    return config.get("ticket_pattern", DEFAULT_CONFIG["ticket_pattern"])
+    return _get_setting("ticket_pattern")
+
+def compile_ticket_pattern(pattern):
+    """
+    Compile a ticket pattern for matching git output.
+
+    Plain ASCII patterns are compiled as bytes so that git output can be matched
+    without decoding it. Patterns that would match differently on raw UTF-8 bytes,
+    such as ones using non-ASCII characters, \\b, \\w or ".", are compiled as str.
+    """
+    if pattern.isascii() and not UNICODE_SENSITIVE_RE.search(pattern):
+        return re.compile(pattern.encode())
+    return re.compile(pattern)
+
+def get_ticket_pattern_re():
+    """Get the ticket pattern compiled for matching git output."""
+    ticket_pattern_re = globals().get('_TICKET_PATTERN_RE')
+    if ticket_pattern_re is None:
+        ticket_pattern_re = compile_ticket_pattern(get_ticket_pattern())
+        globals()['_TICKET_PATTERN_RE'] = ticket_pattern_re
+    return ticket_pattern_re
 
 def get_tag_format():
     """Get the tag format pattern."""
-    config = load_config()
-    return config.get("tag_format", DEFAULT_CONFIG["tag_format"])
+    return _get_setting("tag_format")
 
 def get_project_name():
     """Get the project name."""
-    config = load_config()
-    return config.get("project_name", DEFAULT_CONFIG["project_name"])
+    return _get_setting("project_name")
 
 def get_message_format():
     """Get the message format (markdown or plain)."""
-    config = load_config()
-    return config.get("message_format", DEFAULT_CONFIG["message_format"])
+    return _get_setting("message_format")
 
 def get_templates_dir():
     """Get the templates directory path."""
-    config = load_config()
-    templates_dir = config.get("templates_dir", DEFAULT_CONFIG["templates_dir"])
-    return os.path.expanduser(templates_dir)
+    return os.path.expanduser(_get_setting("templates_dir"))
+
+def get_project_name_from_url(remote_url):
+    """
+    Get the project name from a git remote URL.
+
+    Handles formats such as https://github.com/user/project.git,
+    git@github.com:user/project.git and URLs with a trailing slash.
+    A path ending in a bare .git directory, such as /srv/project/.git,
+    yields None so that callers fall back to another name.
+    """
+    match = PROJECT_NAME_RE.search(remote_url)
+    if not match or match.group(1) == '.git':
+        return None
+    return match.group(1)
 
 def get_project_name_from_git():
     """Get project name from git remote URL."""
+    import git
+
     try:
         repo = git.Repo(os.getcwd())
         if not repo.remotes:
             return None
 
         # Try to extract project name from the first remote URL
-        remote_url = repo.remotes[0].url
-
-        # Extract project name from remote URL
-        # Handle different formats: https://github.com/user/project.git
-        # or git@github.com:user/project.git
-        if remote_url.endswith('.git'):
-            remote_url = remote_url[:-4]  # Remove .git suffix
-
-        project_name = os.path.basename(remote_url)
-        return project_name
+        return get_project_name_from_url(repo.remotes[0].url)
     except (git.InvalidGitRepositoryError, git.NoSuchPathError, IndexError):
         return None
 
@@ -197,7 +268,7 @@ def generate_local_config():
     # Save local config
     try:
         with open(LOCAL_CONFIG_FILE, 'w', encoding="utf-8") as file:
-            yaml.dump(local_config, file, default_flow_style=False, sort_keys=False)
+            dump_yaml(local_config, file)
         click.echo(f"Local config file created: {LOCAL_CONFIG_FILE}")
         return True
     except IOError as ex:
@@ -222,10 +293,12 @@ def get_local_config_path():
 
 def get_config_content(config_path):
     """Get the content of a configuration file as a formatted string."""
+    import yaml
+
     try:
         with open(config_path, 'r', encoding='utf-8') as file:
-            config_content = yaml.safe_load(file)
-            return yaml.dump(config_content, default_flow_style=False, sort_keys=False)
+            config_content = load_yaml(file)
+            return dump_yaml(config_content)
     except (yaml.YAMLError, IOError) as ex:
         return f"Error reading config file: {str(ex)}"
 
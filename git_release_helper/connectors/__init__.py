@@ -2,8 +2,41 @@
 Connectors for integrating with various ticket management systems.
 """
 
+import importlib
 from git_release_helper.connectors.base import BaseConnector
-from git_release_helper.connectors.jira import JiraConnector
+
+# Connector classes by type, as "module:ClassName" paths imported on first use
+CONNECTORS = {
+    'jira': 'git_release_helper.connectors.jira:JiraConnector',
+}
+
+def _load_connector_class(target):
+    """
+    Import and return the connector class for a registry entry.
+
+    Args:
+        target (str): The "module:ClassName" path of the connector class
+
+    Returns:
+        type: The connector class
+    """
+    module_name, class_name = target.split(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+def __getattr__(name):
+    """
+    Import connector classes on first access so that requests is only loaded when needed.
+
+    Args:
+        name (str): The attribute being looked up
+
+    Returns:
+        type: The requested connector class
+    """
+    for target in CONNECTORS.values():
+        if target.split(':')[1] == name:
+            return _load_connector_class(target)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def get_connector(connector_type, config):
     """
@@ -19,7 +52,9 @@ def get_connector(connector_type, config):
     if not connector_type:
         return None
 
-    if connector_type.lower() == 'jira':
-        return JiraConnector(config)
+    # Configured types are normally lowercase already, so only fold case on a miss
+    target = CONNECTORS.get(connector_type) or CONNECTORS.get(connector_type.lower())
+    if not target:
+        return None
 
-    return None
+    return _load_connector_class(target)(config)
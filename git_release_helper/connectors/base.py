@@ -36,3 +36,23 @@ class BaseConnector(ABC):
         Returns:
             bool: True if connection is valid, False otherwise
         """
+
+    def close(self):
+        """
+        Release any resources held by the connector, such as open connections.
+        """
+
+    def __enter__(self):
+        """
+        Use the connector as a context manager that closes it on exit.
+
+        Returns:
+            BaseConnector: The connector itself
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Close the connector when leaving the context.
+        """
+        self.close()
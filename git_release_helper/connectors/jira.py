@@ -2,9 +2,36 @@
 Jira connector for fetching ticket information.
 """
 
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import click
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from git_release_helper.config import CONFIG_DIR, ensure_config_dir
 from git_release_helper.connectors.base import BaseConnector
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Issue fields read from Jira; requesting only these keeps responses small
+TICKET_FIELDS = ("summary", "status")
+
+# Number of tickets looked up per JQL search request; matches the page size
+# Jira Cloud returns by default
+SEARCH_BATCH_SIZE = 50
+
+# Seconds a connection check result is reused before Jira is asked again
+VALIDATION_TTL = 300
+
+# Maximum number of fetched tickets kept in a connector's cache
+TICKET_CACHE_MAX_ITEMS = 1000
+
 class JiraConnector(BaseConnector):
     """Connector for Jira API."""
 
@@ -17,9 +44,82 @@ class JiraConnector(BaseConnector):
         """
         super().__init__(config)
         self.api_url = config.get('api_url', '').rstrip('/')
+        self._browse_prefix = f"{self.api_url}/browse/"
+        self._issue_url_prefix = f"{self.api_url}/rest/api/3/issue/"
+        self._myself_url = f"{self.api_url}/rest/api/3/myself"
+        self._search_url = f"{self.api_url}/rest/api/3/search/jql"
         self.username = config.get('username', '')
         self.api_key = config.get('api_key', '')
+        self._auth = (self.username, self.api_key)
         self.request_timeout = 10
+        self.max_concurrent = max(1, int(config.get('max_concurrent', 5)))
+        self._validation_state = None
+        self._validation_ts = 0
+        self._ticket_cache = OrderedDict()
+
+        # Reuse connections to the Jira host across requests instead of
+        # paying for a new TCP and TLS handshake on every call
+        self._session = self._create_session(config)
+        self._session.auth = self._get_auth()
+        # Retry rate-limited and transient server errors with exponential backoff,
+        # then hand the last response back so it's reported like any other failure
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # Keep a pooled connection per worker so parallel lookups don't wait on the pool
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=max(20, self.max_concurrent),
+            max_retries=retry
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    @staticmethod
+    def _create_session(config):
+        """
+        Create the HTTP session, caching responses on disk if enabled in the configuration.
+
+        Args:
+            config (dict): Configuration for the Jira connector
+
+        Returns:
+            requests.Session: The session to send Jira requests through
+        """
+        cache_expire_after = config.get('cache_expire_after')
+        if cache_expire_after:
+            try:
+                import requests_cache
+            except ImportError:
+                click.echo(
+                    "Warning: cache_expire_after is set but requests-cache is not installed; "
+                    "Jira responses will not be cached.",
+                    err=True
+                )
+                return requests.Session()
+
+            ensure_config_dir()
+            # requests-cache leaves credentials out of its cache keys, so keep a
+            # separate cache per Jira user to never serve one account's data to another
+            user_digest = hashlib.sha256(config.get('username', '').encode()).hexdigest()[:16]
+            return requests_cache.CachedSession(
+                os.path.join(CONFIG_DIR, f"jira_cache_{user_digest}"),
+                backend='sqlite',
+                # Jira marks its API responses as uncacheable, so the configured
+                # expiry decides instead; expired entries are revalidated with
+                # their ETag or Last-Modified date when the server provides one
+                expire_after=cache_expire_after,
+                # The HEAD connection check is left uncached so that a revoked or
+                # wrong API key is always noticed
+                allowable_methods=('GET', 'POST')
+            )
+
+        return requests.Session()
 
     def _get_auth(self):
         """
@@ -28,7 +128,7 @@ class JiraConnector(BaseConnector):
         Returns:
             tuple: Authentication tuple (username, api_key)
         """
-        return (self.username, self.api_key)
+        return self._auth
 
     def validate_connection(self):
         """
@@ -40,15 +140,156 @@ class JiraConnector(BaseConnector):
         if not self.api_url or not self.username or not self.api_key:
             return False
 
+        if (self._validation_state is not None
+                and time.monotonic() - self._validation_ts < VALIDATION_TTL):
+            return self._validation_state
+
         try:
-            response = requests.get(
-                f"{self.api_url}/rest/api/3/myself",
-                auth=self._get_auth(),
+            # Only the status code matters here, so skip transferring the user's profile
+            response = self._session.head(
+                self._myself_url,
+                allow_redirects=True,
                 timeout=self.request_timeout
             )
-            return response.status_code == 200
+            valid = response.status_code == 200
         except (requests.RequestException, ConnectionError):
-            return False
+            valid = False
+
+        self._validation_state = valid
+        self._validation_ts = time.monotonic()
+        return valid
+
+    @staticmethod
+    def _decode_json(response):
+        """
+        Decode a JSON response body, using orjson when it is installed.
+
+        Args:
+            response (requests.Response): Response to decode
+
+        Returns:
+            dict: Decoded JSON body
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    def _ticket_info(self, ticket_id, fields):
+        """
+        Build the details entry for a ticket from its Jira fields.
+
+        Args:
+            ticket_id (str): Jira ticket ID
+            fields (dict): The issue's "fields" object from the Jira API, if any
+
+        Returns:
+            dict: Ticket details (title, status, url)
+        """
+        fields = fields or {}
+        status = fields.get('status') or {}
+        return {
+            'title': fields.get('summary', 'Unknown'),
+            'status': status.get('name', 'Unknown'),
+            'url': self._browse_prefix + ticket_id
+        }
+
+    def _missing_ticket_info(self, ticket_id):
+        """
+        Build the details entry for a ticket that could not be fetched.
+
+        Args:
+            ticket_id (str): Jira ticket ID
+
+        Returns:
+            dict: Placeholder ticket details
+        """
+        return {
+            'title': 'Could not fetch ticket details',
+            'status': 'Unknown',
+            'url': self._browse_prefix + ticket_id
+        }
+
+    def _fetch_ticket(self, ticket_id):
+        """
+        Fetch the details of a single ticket.
+
+        Args:
+            ticket_id (str): Jira ticket ID
+
+        Returns:
+            dict: Ticket details, or an error entry if the request failed
+        """
+        try:
+            response = self._session.get(
+                self._issue_url_prefix + ticket_id,
+                params={'fields': ",".join(TICKET_FIELDS)},
+                timeout=self.request_timeout
+            )
+
+            if response.status_code == 200:
+                return self._ticket_info(ticket_id, self._decode_json(response).get('fields'))
+            return self._missing_ticket_info(ticket_id)
+        except (requests.RequestException, ValueError) as ex:
+            return {
+                'title': f'Error fetching ticket: {str(ex)}',
+                'status': 'Error',
+                'url': self._browse_prefix + ticket_id
+            }
+
+    def _fetch_tickets(self, ticket_ids):
+        """
+        Fetch tickets one by one from the per-issue endpoint, several at a time.
+
+        Args:
+            ticket_ids (list): Jira ticket IDs
+
+        Returns:
+            dict: Mapping of ticket IDs to their details
+        """
+        if len(ticket_ids) == 1:
+            return {ticket_ids[0]: self._fetch_ticket(ticket_ids[0])}
+
+        workers = min(self.max_concurrent, len(ticket_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(ticket_ids, executor.map(self._fetch_ticket, ticket_ids)))
+
+    def _search_tickets(self, ticket_ids):
+        """
+        Fetch the details of several tickets with a single JQL search.
+
+        Args:
+            ticket_ids (list): Jira ticket IDs, at most SEARCH_BATCH_SIZE of them
+
+        Returns:
+            dict: Mapping of ticket IDs to their details, or None if the search failed
+        """
+        keys = ",".join(f'"{ticket_id}"' for ticket_id in ticket_ids)
+        try:
+            response = self._session.post(
+                self._search_url,
+                json={
+                    'jql': f"key in ({keys})",
+                    'fields': list(TICKET_FIELDS),
+                    'maxResults': len(ticket_ids)
+                },
+                timeout=self.request_timeout
+            )
+
+            # Jira rejects the whole query when any key does not exist
+            if response.status_code != 200:
+                return None
+            issues = self._decode_json(response).get('issues', [])
+        except (requests.RequestException, ValueError):
+            return None
+
+        found = {
+            issue['key']: self._ticket_info(issue['key'], issue.get('fields'))
+            for issue in issues if 'key' in issue
+        }
+        return {
+            ticket_id: found.get(ticket_id) or self._missing_ticket_info(ticket_id)
+            for ticket_id in ticket_ids
+        }
 
     def get_ticket_details(self, ticket_ids):
         """
@@ -64,34 +305,38 @@ class JiraConnector(BaseConnector):
             return {}
 
         result = {}
+        uncached_ids = []
+        # Look up each ticket once even if it is listed several times
+        for ticket_id in dict.fromkeys(ticket_ids):
+            if ticket_id in self._ticket_cache:
+                self._ticket_cache.move_to_end(ticket_id)
+                result[ticket_id] = self._ticket_cache[ticket_id]
+            else:
+                uncached_ids.append(ticket_id)
 
-        for ticket_id in ticket_ids:
-            try:
-                response = requests.get(
-                    f"{self.api_url}/rest/api/3/issue/{ticket_id}",
-                    auth=self._get_auth(),
-                    timeout=self.request_timeout
-                )
+        if len(uncached_ids) == 1:
+            fetched = self._fetch_tickets(uncached_ids)
+        else:
+            fetched = {}
+            for start in range(0, len(uncached_ids), SEARCH_BATCH_SIZE):
+                batch = uncached_ids[start:start + SEARCH_BATCH_SIZE]
+                batch_result = self._search_tickets(batch)
+                if batch_result is None:
+                    batch_result = self._fetch_tickets(batch)
+                fetched.update(batch_result)
 
-                if response.status_code == 200:
-                    issue_data = response.json()
-                    result[ticket_id] = {
-                        'title': issue_data.get('fields', {}).get('summary', 'Unknown'),
-                        'status': issue_data.get('fields', {}).get('status', {}).get(
-                            'name', 'Unknown'),
-                        'url': f"{self.api_url}/browse/{ticket_id}"
-                    }
-                else:
-                    result[ticket_id] = {
-                        'title': 'Could not fetch ticket details',
-                        'status': 'Unknown',
-                        'url': f"{self.api_url}/browse/{ticket_id}"
-                    }
-            except (requests.RequestException, ValueError) as ex:
-                result[ticket_id] = {
-                    'title': f'Error fetching ticket: {str(ex)}',
-                    'status': 'Error',
-                    'url': f"{self.api_url}/browse/{ticket_id}"
-                }
+        for ticket_id, ticket_info in fetched.items():
+            # Leave failed lookups out of the cache so they are retried next time
+            if ticket_info['status'] not in ('Error', 'Unknown'):
+                self._ticket_cache[ticket_id] = ticket_info
+                if len(self._ticket_cache) > TICKET_CACHE_MAX_ITEMS:
+                    self._ticket_cache.popitem(last=False)
+        result.update(fetched)
 
         return result
+
+    def close(self):
+        """
+        Close the HTTP session and its pooled connections.
+        """
+        self._session.close()
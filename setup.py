@@ -13,6 +13,10 @@ setup(
         "PyYAML",
         "requests",
     ],
+    extras_require={
+        "fast-json": ["orjson"],
+        "cache": ["requests-cache"],
+    },
     entry_points={
         "console_scripts": [
             "release=git_release_helper.cli:main",